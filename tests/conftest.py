@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture
+def header():
+    """A minimal UE5 GVAS header that write_savefile and read_savefile accept."""
+    return {
+        "magic": "GVAS",
+        "save_game_version": 3,
+        "file_version_ue4": 522,
+        "file_version_ue5": 1009,
+        "engine_version": {"major": 5, "minor": 3, "patch": 2,
+                           "changelist": 0, "branch": "++UE5+Release-5.3"},
+        "custom_versions_format": 3,
+        "custom_versions": [],
+        "save_game_class_name": "/Script/Game.TestSaveGame",
+    }
@@ -0,0 +1,38 @@
+import gzip
+
+from uesave import (IntProperty, SaveFile, StrProperty, decompress_payload,
+                    decompress_payload_into, read_savefile, write_savefile)
+
+
+def _make_save(header) -> SaveFile:
+    properties = [
+        IntProperty(name="Level", tag=0, size=4, value=7, int_tag=0),
+        StrProperty(name="Player", tag=0, size=305, value="x" * 300),
+    ]
+    return SaveFile(header=header, properties=properties)
+
+
+def test_decompress_payload_into_multi_member_gzip():
+    a, b = b"a" * 50, b"b" * 54
+    raw = gzip.compress(a) + gzip.compress(b)
+    for method in ("auto", "gzip"):
+        # both with and without a preallocated output buffer
+        for out in (bytearray(), bytearray(256)):
+            assert decompress_payload_into(raw, out, method) == len(a + b)
+            assert bytes(out) == decompress_payload(raw, method) == a + b
+
+
+def test_read_savefile_multi_member_gzip(tmp_path, header):
+    plain = tmp_path / "plain.sav"
+    write_savefile(plain, _make_save(header))
+    data = plain.read_bytes()
+
+    # the GVAS payload split across two gzip members
+    split = len(data) // 2
+    packed = tmp_path / "packed.sav"
+    packed.write_bytes(gzip.compress(data[:split]) + gzip.compress(data[split:]))
+
+    save = read_savefile(packed)
+    assert [p.name for p in save.properties] == ["Level", "Player"]
+    assert save.properties[0].value == 7
+    assert save.properties[1].value == "x" * 300
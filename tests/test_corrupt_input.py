@@ -0,0 +1,62 @@
+import struct
+import tracemalloc
+import zlib
+
+import pytest
+
+from uesave import (ArrayProperty, DecompressionError, SaveFile,
+                    decompress_payload, decompress_payload_into, read_savefile,
+                    write_savefile)
+
+
+def _peak_bytes(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+    finally:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak
+
+
+def test_string_array_with_corrupt_count(tmp_path, header):
+    # one element on disk, 200M claimed by the count
+    names = ArrayProperty(name="Names", tag=0, size=4 + 6, inner_type="StrProperty",
+                          array_size=200_000_000, values=["a"])
+    path = tmp_path / "corrupt.sav"
+    write_savefile(path, SaveFile(header=header, properties=[names]))
+
+    def read():
+        with pytest.raises(ValueError):
+            read_savefile(path)
+
+    # the count must not size any allocation
+    assert _peak_bytes(read) < 16 * 1024 * 1024
+
+
+def _lying_chunked_archive() -> bytes:
+    # one UE compressed chunk that claims 1.5 GB around a 4-byte payload
+    claimed = 1536 * 1024 * 1024
+    payload = zlib.compress(b"GVAS")
+    return (struct.pack("<4q", 0x9E2A83C1, claimed, len(payload), claimed)
+            + struct.pack("<2q", len(payload), claimed) + payload)
+
+
+def test_chunked_archive_with_lying_sizes(tmp_path):
+    archive = _lying_chunked_archive()
+    path = tmp_path / "lying.sav"
+    path.write_bytes(archive)
+
+    def decompress():
+        with pytest.raises(DecompressionError):
+            decompress_payload(archive)
+        with pytest.raises(DecompressionError):
+            decompress_payload_into(archive, bytearray())
+
+    def read():
+        with pytest.raises(ValueError):
+            read_savefile(path)
+
+    # the claimed sizes must not size any allocation
+    assert _peak_bytes(decompress) < 16 * 1024 * 1024
+    assert _peak_bytes(read) < 16 * 1024 * 1024
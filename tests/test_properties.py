@@ -0,0 +1,61 @@
+import struct
+
+from uesave import (ArrayProperty, IntProperty, SaveFile, StrProperty,
+                    read_savefile, write_savefile)
+
+
+def _round_trip(tmp_path, save: SaveFile):
+    """Write a save, read it back and write it again; returns the re-read
+    save and the bytes of both writes."""
+    first = tmp_path / "first.sav"
+    second = tmp_path / "second.sav"
+    write_savefile(first, save)
+    reread = read_savefile(first)
+    write_savefile(second, reread)
+    return reread, first.read_bytes(), second.read_bytes()
+
+
+def test_byte_and_fallback_arrays_round_trip(tmp_path, header):
+    payload = bytes(range(256)) * 3
+    # an inner type without a dedicated codec keeps its elements as raw bytes
+    objects = b"\x05\x00\x00\x00Obj1\x00" * 4
+    properties = [
+        ArrayProperty(name="Blob", tag=0, size=4 + len(payload), inner_type="ByteProperty",
+                      array_size=len(payload), values=payload),
+        ArrayProperty(name="Refs", tag=0, size=4 + len(objects), inner_type="ObjectProperty",
+                      array_size=4, values=objects),
+        # anything after the arrays only parses if they consumed exactly their size
+        IntProperty(name="After", tag=0, size=4, value=42, int_tag=0),
+    ]
+
+    reread, first, second = _round_trip(tmp_path, SaveFile(header=header, properties=properties))
+
+    assert first == second
+    blob, refs, after = reread.properties
+    assert bytes(blob.value["__values"]) == payload
+    assert bytes(refs.value["__values"]) == objects
+    assert (after.name, after.value) == ("After", 42)
+
+
+def test_non_ascii_strings_round_trip_as_utf16(tmp_path, header):
+    name = "Jörg 🎮 ßpieler"
+    branch = "++UE5+Release-5.3-ünicode"
+    header["engine_version"]["branch"] = branch
+    encoded = name.encode("utf-16-le")
+    properties = [
+        # size: length prefix + UTF-16LE code units + 2-byte terminator
+        StrProperty(name="Player", tag=0, size=4 + len(encoded) + 2, value=name),
+        IntProperty(name="After", tag=0, size=4, value=7, int_tag=0),
+    ]
+
+    reread, first, second = _round_trip(tmp_path, SaveFile(header=header, properties=properties))
+
+    assert first == second
+    # a negative length counts UTF-16 code units, the emoji is a surrogate pair
+    for s in (name, branch):
+        raw = s.encode("utf-16-le")
+        assert struct.pack("<i", -(len(raw) // 2 + 1)) + raw + b"\x00\x00" in first
+    assert reread.header["engine_version"]["branch"] == branch
+    player, after = reread.properties
+    assert player.value == name
+    assert (after.name, after.value) == ("After", 7)
@@ -1,7 +1,12 @@
 import gzip
+import mmap
+import os
 import struct
+import sys
+import threading
 import zlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import *
@@ -17,111 +22,169 @@ try:
 except Exception:  # pragma: no cover
     zstd = None
 
+# optional ISA-L inflate: drop-in zlib/gzip replacements with a faster decoder
+try:
+    from isal import igzip as inflate_gzip  # type: ignore
+    from isal import isal_zlib as inflate_zlib  # type: ignore
+except Exception:  # pragma: no cover
+    inflate_gzip = gzip
+    inflate_zlib = zlib
+
 MAGIC = b'GVAS'  # UE SaveGame header magic
+# sizes of the small headers some games put in front of a compressed GVAS payload
+_CONTAINER_PREFIX_SIZES = (4, 8, 12, 16)
+
+# precompiled little-endian codecs for the primitive readers
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+_I64 = struct.Struct('<q')
+_U64 = struct.Struct('<Q')
+_F32 = struct.Struct('<f')
+_F64 = struct.Struct('<d')
+_VEC3 = struct.Struct('<3f')
+_QUAT = struct.Struct('<4f')
+_GUID = struct.Struct('<IHH2s6s')
+_CUSTOM_VERSION = struct.Struct('<16si')  # raw GUID bytes + version
+_SIZE_TAG = struct.Struct('<II')  # property size + tag
+
+# struct codes of ArrayProperty inner types with fixed-width elements
+_ARRAY_ELEMENT_CODES: Dict[str, str] = {
+    "IntProperty": "i",
+    "FloatProperty": "f",
+    "DoubleProperty": "d",
+    "Int64Property": "q",
+    "UInt64Property": "Q",
+}
+
+
+# decoded short FStrings keyed by their raw bytes
+_STRING_CACHE: Dict[bytes, str] = {}
+_STRING_CACHE_MAX_LEN = 64
+_STRING_CACHE_MAX_ENTRIES = 4096
 
 
 def _read_u32(data: bytes, offset: int) -> Tuple[int, int]:
-    return struct.unpack_from('<I', data, offset)[0], offset + 4
+    return _U32.unpack_from(data, offset)[0], offset + 4
 
 
 def _write_u32(data: bytearray, v: int) -> None:
-    data.extend(struct.pack('<I', int(v) & 0xFFFFFFFF))
+    data.extend(_U32.pack(int(v) & 0xFFFFFFFF))
 
 
 def _read_i32(data: bytes, offset: int) -> Tuple[int, int]:
-    return struct.unpack_from('<i', data, offset)[0], offset + 4
+    return _I32.unpack_from(data, offset)[0], offset + 4
 
 
 def _write_i32(data: bytearray, v: int) -> None:
-    data.extend(struct.pack('<i', int(v)))
+    data.extend(_I32.pack(int(v)))
 
 
 def _read_u16(data: bytes, offset: int) -> Tuple[int, int]:
-    return struct.unpack_from('<H', data, offset)[0], offset + 2
+    return _U16.unpack_from(data, offset)[0], offset + 2
 
 
 def _write_u16(data: bytearray, v: int) -> None:
-    data.extend(struct.pack('<H', int(v) & 0xFFFF))
+    data.extend(_U16.pack(int(v) & 0xFFFF))
+
+
+def _decode_fstring(raw: bytes, encoding: str, terminator: bytes) -> str:
+    """Decode an FString payload. The well-formed case drops the NUL terminator
+    before a strict decode; anything else takes the tolerant decode + strip path.
+    """
+    if raw[-len(terminator):] == terminator:
+        try:
+            s = str(raw[:-len(terminator)], encoding)
+            if not s.endswith('\x00'):
+                return s
+        except UnicodeDecodeError:
+            pass
+    return str(raw, encoding, 'ignore').rstrip('\x00')
 
 
 def _read_string(data: bytes, offset: int) -> Tuple[str, int]:
     """Read UE FString: int32 length. If negative, it's UTF-16LE and -length is the character count.
     Length typically includes the null terminator; strip trailing NULs.
     """
-    strlen, offset = _read_i32(data, offset)
+    strlen = _I32.unpack_from(data, offset)[0]
+    offset += 4
     if strlen == 0:
         return "", offset
     if strlen < 0:
         # UTF-16LE, -strlen characters (including terminator)
         count = -strlen
         nbytes = count * 2
-        raw = data[offset: offset + nbytes]
+        # decode straight from the (possibly memoryview) buffer, no slice copy
+        s = _decode_fstring(data[offset: offset + nbytes], 'utf-16-le', b'\x00\x00')
         offset += nbytes
-        s = raw.decode('utf-16-le', errors='ignore')
+    elif strlen <= _STRING_CACHE_MAX_LEN:
+        # short strings are mostly property/type names that repeat throughout a save
+        raw = bytes(data[offset: offset + strlen])
+        offset += strlen
+        s = _STRING_CACHE.get(raw)
+        if s is None:
+            s = sys.intern(_decode_fstring(raw, 'utf-8', b'\x00'))
+            if len(_STRING_CACHE) < _STRING_CACHE_MAX_ENTRIES:
+                _STRING_CACHE[raw] = s
     else:
-        raw = data[offset: offset + strlen]
+        s = _decode_fstring(data[offset: offset + strlen], 'utf-8', b'\x00')
         offset += strlen
-        s = raw.decode('utf-8', errors='ignore')
-    s = s.rstrip('\x00')
     return s, offset
 
 
 def _write_string(data: bytearray, s: str) -> None:
-    """Write a UE FString (length includes trailing NUL; 0 means empty)."""
+    """Write a UE FString (length includes trailing NUL; 0 means empty).
+    ASCII strings are stored one byte per char, anything else as UTF-16LE
+    with a negative length counting UTF-16 code units.
+    """
     if not s:
         _write_i32(data, 0)
         return
-    try:
-        _write_i32(data, len(s) + 1)
-        data.extend(s.encode('utf-8'))
-        data.extend(b'\x00')
-    except UnicodeEncodeError:
-        _write_i32(data, -(len(s) * 2 + 1))
-        data.extend(s.encode('utf-16-le', errors='ignore'))
-        data.extend(b'\x00\x00')
+    if s.isascii():
+        data += _I32.pack(len(s) + 1) + s.encode('ascii') + b'\x00'
+    else:
+        raw = s.encode('utf-16-le', errors='ignore')
+        data += _I32.pack(-(len(raw) // 2 + 1)) + raw + b'\x00\x00'
 
 
-def _read_guid(data: bytes, offset: int) -> Tuple[str, int]:
-    """Read a 16-byte GUID and return as standard hex string."""
-    guid = data[offset: offset + 16]
-    offset += 16
+def _format_guid(raw: bytes) -> str:
+    """Format 16 raw GUID bytes as a standard hex string ("" if truncated)."""
     # UE stores GUID as raw 16 bytes; represent in canonical form
     # break into 4-2-2-2-6 bytes per RFC 4122
-    if len(guid) != 16:
-        return "", offset
-    part1 = guid[0:4][::-1].hex()  # little-endian to big for common display
-    part2 = guid[4:6][::-1].hex()
-    part3 = guid[6:8][::-1].hex()
-    part4 = guid[8:10].hex()
-    part5 = guid[10:16].hex()
-    guid = f"{part1}-{part2}-{part3}-{part4}-{part5}"
-    return guid, offset
+    if len(raw) != 16:
+        return ""
+    # the little-endian unpack of the first three groups does the byte swap
+    a, b, c, d, e = _GUID.unpack(raw)
+    return '%08x-%04x-%04x-%s-%s' % (a, b, c, d.hex(), e.hex())
+
+
+def _read_guid(data: bytes, offset: int) -> Tuple[str, int]:
+    """Read a 16-byte GUID and return as standard hex string."""
+    return _format_guid(data[offset: offset + 16]), offset + 16
 
 
 def _write_guid(data: bytearray, guid: str) -> None:
     """Write a GUID string as 16 raw bytes."""
-    parts = guid.split('-')
-    if len(parts) != 5:
-        data.extend(b'\x00' * 16)
-        return
     try:
-        part1 = bytes.fromhex(parts[0])[::-1]  # big-endian to little
-        part2 = bytes.fromhex(parts[1])[::-1]
-        part3 = bytes.fromhex(parts[2])[::-1]
-        part4 = bytes.fromhex(parts[3])
-        part5 = bytes.fromhex(parts[4])
-        if len(part1) != 4 or len(part2) != 2 or len(part3) != 2 or len(part4) != 2 or len(part5) != 6:
+        part1, part2, part3, part4, part5 = guid.split('-')
+        if (len(part1), len(part2), len(part3), len(part4), len(part5)) != (8, 4, 4, 4, 12):
             raise ValueError("Invalid GUID part length")
-        data.extend(part1)
-        data.extend(part2)
-        data.extend(part3)
-        data.extend(part4)
-        data.extend(part5)
+        # first three groups are little-endian integers, the rest raw bytes
+        data.extend(_GUID.pack(int(part1, 16), int(part2, 16), int(part3, 16),
+                               bytes.fromhex(part4), bytes.fromhex(part5)))
     except Exception:
         data.extend(b'\x00' * 16)
 
 
+# serialized "None" name that terminates a property list
+_NONE_TERMINATOR = b"\x05\x00\x00\x00None\x00"
+
+
 def _read_property(data: bytes, offset: int) -> Tuple[Optional['Property'], int]:
+    # recognize the terminator from its bytes without decoding a string
+    if data[offset: offset + 9] == _NONE_TERMINATOR:
+        return None, offset + 9
+
     prop_name, offset = _read_string(data, offset)
 
     if prop_name == "None" or prop_name == "":
@@ -129,19 +192,30 @@ def _read_property(data: bytes, offset: int) -> Tuple[Optional['Property'], int]
 
     prop_type, offset = _read_string(data, offset)
 
-    prop_size, offset = _read_u32(data, offset)
-    prop_tag, offset = _read_u32(data, offset)
+    prop_size, prop_tag = _SIZE_TAG.unpack_from(data, offset)
+    offset += 8
+
+    # dispatch straight to the parser, without going through PropertyFactory
+    from_bytes = _FROM_BYTES.get(prop_type)
+    if from_bytes is None:
+        raise ValueError(f"Unknown property type: {prop_type}")
+    return from_bytes(prop_name, prop_size, prop_tag, data, offset)
 
-    prop, offset = PropertyFactory.create_property(
-        name=prop_name,
-        prop_type=prop_type,
-        prop_size=prop_size,
-        prop_tag=prop_tag,
-        data=data,
-        offset=offset
-    )
 
-    return prop, offset
+def _read_fields(data: bytes, offset: int, end_offset: int) -> Tuple[List['Property'], int]:
+    """Read nested properties up to end_offset or the "None" sentinel, whichever comes first."""
+    fields = []
+    append = fields.append
+    read_property = _read_property
+    while offset < end_offset:
+        field, offset = read_property(data, offset)
+
+        if field is None:
+            break
+
+        append(field)
+
+    return fields, offset
 
 
 def _write_property(data: bytearray, prop: 'Property') -> None:
@@ -156,6 +230,8 @@ def _write_property(data: bytearray, prop: 'Property') -> None:
 
 
 class Property(ABC):
+    __slots__ = ('_name', '_tag', '_size')
+
     def __init__(self, name: str, tag: int, size: int):
         self._name = name
         self._tag = tag
@@ -188,7 +264,19 @@ class Property(ABC):
         pass
 
 
+# parser of each property type, keyed by the type name as serialized
+_FROM_BYTES: Dict[str, Callable[..., Tuple[Property, int]]] = {}
+
+
+def _register(cls: Type[Property]) -> Type[Property]:
+    _FROM_BYTES[sys.intern(cls.__name__)] = cls.from_bytes
+    return cls
+
+
+@_register
 class ArrayProperty(Property):
+    __slots__ = ('_inner_type', '_array_size', '_values')
+
     def __init__(self, name: str, tag: int, size: int, inner_type: str, array_size: int, values: Union[bytes, list]):
         super().__init__(name, tag, size)
         self._inner_type = inner_type
@@ -217,40 +305,34 @@ class ArrayProperty(Property):
         inner_type, offset = _read_string(data, offset)
         assert (data[offset] == 0)
         offset += 1  # null byte
-        array_size, offset = _read_u32(data, offset)
+        array_size = _U32.unpack_from(data, offset)[0]
+        offset += 4
         if inner_type == "ByteProperty":
-            values = data[offset: offset + prop_size]
+            # prop_size includes the 4-byte element count read above
+            values = bytes(data[offset: offset + prop_size - 4])
             offset += prop_size - 4
         elif inner_type in ["StrProperty", "NameProperty"]:
-            values = []
-            for i in range(array_size):
-                value, offset = _read_string(data, offset)
-                values.append(value)
-        elif inner_type == "IntProperty":
-            values = []
+            # element count is known upfront: allocate the list once. every
+            # element has at least a 4-byte length, so a count the property
+            # (or the buffer) can't hold is corrupt; don't allocate for it
+            if array_size > min(prop_size - 4, len(data) - offset) // 4:
+                raise ValueError(
+                    f"{inner_type} array '{name}' claims {array_size} elements in {prop_size} bytes")
+            values = [None] * array_size
+            read_string = _read_string
             for i in range(array_size):
-                value, offset = _read_i32(data, offset)
-                values.append(value)
+                values[i], offset = read_string(data, offset)
+        elif inner_type in _ARRAY_ELEMENT_CODES:
+            # fixed-width elements: decode the whole span in one call
+            fmt = f"<{array_size}{_ARRAY_ELEMENT_CODES[inner_type]}"
+            values = list(struct.unpack_from(fmt, data, offset))
+            offset += struct.calcsize(fmt)
         elif inner_type == "StructProperty":
-            values = []
-            end_offset = offset + prop_size
-            while offset < end_offset:
-                value, offset = _read_property(data, offset)
-
-                if value is None:
-                    break
-
-                values.append(value)
-        elif inner_type == "FloatProperty":
-            values = []
-            for i in range(array_size):
-                v = struct.unpack_from('<f', data, offset)[0]
-                offset += 4
-                values.append(v)
+            values, offset = _read_fields(data, offset, offset + prop_size)
         else:
             # Fallback: store raw bytes for unknown inner types to avoid hard failure
-            values = data[offset: offset + prop_size]
-            offset += prop_size
+            values = bytes(data[offset: offset + prop_size - 4])
+            offset += prop_size - 4
 
         return cls(name=name, tag=prop_tag, size=prop_size, inner_type=inner_type, array_size=array_size, values=values), offset
 
@@ -268,19 +350,18 @@ class ArrayProperty(Property):
             for v in self._values:
                 _write_string(data, str(v))
             return
-        elif self._inner_type == "IntProperty":
-            for v in self._values:
-                _write_i32(data, int(v))
+        elif self._inner_type in _ARRAY_ELEMENT_CODES:
+            # fixed-width elements: encode the whole span in one call. struct
+            # rejects e.g. 2.0 for an integer code, so values are coerced first
+            code = _ARRAY_ELEMENT_CODES[self._inner_type]
+            convert = float if code in "fd" else int
+            data.extend(struct.pack(f"<{len(self._values)}{code}", *map(convert, self._values)))
             return
         elif self._inner_type == "StructProperty":
             for val in self._values:
                 _write_property(data, val)
             _write_string(data, "None")
             return
-        elif self._inner_type == "FloatProperty":
-            for v in self._values:
-                data.extend(struct.pack('<f', float(v)))
-            return
         else:
             # If values is raw bytes (fallback), write as-is
             if isinstance(self._values, (bytes, bytearray)):
@@ -293,7 +374,10 @@ class ArrayProperty(Property):
         return f"ArrayProperty(name={self._name}, inner_type={self._inner_type}, length={len(self._values)})"
 
 
+@_register
 class BoolProperty(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: bool):
         super().__init__(name, tag, size)
         self._value = value
@@ -323,7 +407,10 @@ class BoolProperty(Property):
         return f"BoolProperty(name={self._name}, value={self._value})"
 
 
+@_register
 class ByteProperty(Property):
+    __slots__ = ('_guid', '_value')
+
     def __init__(self, name: str, tag: int, size: int, guid: str, value: int):
         super().__init__(name, tag, size)
         self._guid = guid
@@ -357,7 +444,10 @@ class ByteProperty(Property):
         return f"ByteProperty(name={self._name}, guid={self._guid}, value={self._value})"
 
 
+@_register
 class DoubleProperty(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: float):
         super().__init__(name, tag, size)
         self._value = value
@@ -369,18 +459,21 @@ class DoubleProperty(Property):
     @classmethod
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['DoubleProperty', int]:
         assert (prop_size == 8)
-        value = struct.unpack_from('<d', data, offset)[0]
+        value = _F64.unpack_from(data, offset)[0]
         offset += 8
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
 
     def to_bytes(self, data: bytearray) -> None:
-        data.extend(struct.pack('<d', float(self._value)))
+        data.extend(_F64.pack(float(self._value)))
 
     def __str__(self):
         return f"DoubleProperty(name={self._name}, value={self._value})"
 
 
+@_register
 class FloatProperty(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: float):
         super().__init__(name, tag, size)
         self._value = value
@@ -396,18 +489,21 @@ class FloatProperty(Property):
     @classmethod
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['FloatProperty', int]:
         assert (prop_size == 4)
-        value = struct.unpack_from('<f', data, offset)[0]
+        value = _F32.unpack_from(data, offset)[0]
         offset += 4
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
 
     def to_bytes(self, data: bytearray) -> None:
-        data.extend(struct.pack('<f', float(self._value)))
+        data.extend(_F32.pack(float(self._value)))
 
     def __str__(self):
         return f"FloatProperty(name={self._name}, value={self._value})"
 
 
+@_register
 class Int64Property(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: int):
         super().__init__(name, tag, size)
         self._value = value
@@ -419,18 +515,21 @@ class Int64Property(Property):
     @classmethod
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['Int64Property', int]:
         assert (prop_size == 8)
-        value = struct.unpack_from('<q', data, offset)[0]
+        value = _I64.unpack_from(data, offset)[0]
         offset += 8
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
 
     def to_bytes(self, data: bytearray) -> None:
-        data.extend(struct.pack('<q', int(self._value)))
+        data.extend(_I64.pack(int(self._value)))
 
     def __str__(self):
         return f"Int64Property(name={self._name}, value={self._value})"
 
 
+@_register
 class IntProperty(Property):
+    __slots__ = ('_value', '_int_tag')
+
     def __init__(self, name: str, tag: int, size: int, value: int, int_tag: int):
         super().__init__(name, tag, size)
         self._value = value
@@ -443,7 +542,7 @@ class IntProperty(Property):
     @classmethod
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['IntProperty', int]:
         assert (prop_size == 4)
-        value = _read_i32(data, offset)[0]
+        value = _I32.unpack_from(data, offset)[0]
         offset += 4
         int_tag = data[offset]
         # assert (int_tag == 0 or int_tag == 0xff)
@@ -451,14 +550,17 @@ class IntProperty(Property):
         return cls(name=name, tag=prop_tag, size=prop_size, value=value, int_tag=int_tag), offset
 
     def to_bytes(self, data: bytearray) -> None:
-        data.extend(struct.pack('<i', int(self._value)))
+        data.extend(_I32.pack(int(self._value)))
         data.append(self._int_tag)  # mysterious byte
 
     def __str__(self):
         return f"IntProperty(name={self._name}, value={self._value})"
 
 
+@_register
 class MapProperty(Property):
+    __slots__ = ('_key_type', '_value_type', '_map_size', '_raw_bytes')
+
     def __init__(self, name: str, tag: int, size: int, key_type: str, value_type: str, map_size: int, raw_bytes: bytes):
         super().__init__(name, tag, size)
         self._key_type = key_type
@@ -478,7 +580,7 @@ class MapProperty(Property):
         offset += 1  # null byte
         map_size, offset = _read_u32(data, offset)
         # TODO: parse entries
-        raw_bytes = data[offset: offset + prop_size - 5]
+        raw_bytes = bytes(data[offset: offset + prop_size - 5])
         offset += prop_size - 5
         assert (data[offset] == 0)
         offset += 1  # null byte
@@ -498,7 +600,10 @@ class MapProperty(Property):
         return f"MapProperty(name={self._name}, key_type={self._key_type}, value_type={self._value_type}, raw_size={len(self._raw_bytes)})"
 
 
+@_register
 class NameProperty(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: str):
         super().__init__(name, tag, size)
         self._value = value
@@ -511,8 +616,10 @@ class NameProperty(Property):
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['NameProperty', int]:
         assert (data[offset] == 0)
         offset += 1  # null byte
+        start = offset
         value, offset = _read_string(data, offset)
-        assert ((len(value) + 4 + 1) == prop_size)
+        # the size covers the serialized FString: 1 byte per char, or 2 for UTF-16
+        assert (prop_size == offset - start)
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
 
     def to_bytes(self, data: bytearray) -> None:
@@ -523,7 +630,10 @@ class NameProperty(Property):
         return f"NameProperty(name={self._name}, value={self._value})"
 
 
+@_register
 class ObjectProperty(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: str):
         super().__init__(name, tag, size)
         self._value = value
@@ -536,8 +646,10 @@ class ObjectProperty(Property):
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['ObjectProperty', int]:
         assert (data[offset] == 0)
         offset += 1  # null byte
+        start = offset
         value, offset = _read_string(data, offset)
-        assert ((len(value) + 4 + 1) == prop_size)
+        # the size covers the serialized FString: 1 byte per char, or 2 for UTF-16
+        assert (prop_size == offset - start)
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
 
     def to_bytes(self, data: bytearray) -> None:
@@ -548,7 +660,10 @@ class ObjectProperty(Property):
         return f"ObjectProperty(name={self._name}, value={self._value})"
 
 
+@_register
 class StrProperty(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: str):
         super().__init__(name, tag, size)
         self._value = value
@@ -561,8 +676,10 @@ class StrProperty(Property):
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['StrProperty', int]:
         assert (data[offset] == 0)
         offset += 1  # null byte
+        start = offset
         value, offset = _read_string(data, offset)
-        assert (prop_size == len(value) + 4 + (1 if value else 0))
+        # the size covers the serialized FString: 1 byte per char, or 2 for UTF-16
+        assert (prop_size == offset - start)
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
 
     def to_bytes(self, data: bytearray) -> None:
@@ -573,19 +690,26 @@ class StrProperty(Property):
         return f"StrProperty(name={self._name}, value={self._value})"
 
 
+@_register
 class StructProperty(Property):
-    def __init__(self, name: str, tag: int, size: int, type: str, guid: Optional[str], fields: List[Property]):
+    __slots__ = ('_type', '_guid', '_fields', '_components')
+
+    def __init__(self, name: str, tag: int, size: int, type: str, guid: Optional[str],
+                 fields: Optional[List[Property]] = None, components: Optional[Tuple[float, ...]] = None):
         super().__init__(name, tag, size)
         self._type = type
         self._guid = guid
+        # Quat/Vector structs keep their floats as a plain tuple; the
+        # FloatProperty fields are only built when asked for
         self._fields = fields
+        self._components = components
 
     @property
     def value(self) -> Dict[str, Any]:
         return {
             "__type": self._type,
             "__guid": self._guid,
-            "__fields": self._fields,
+            "__fields": self.fields,
         }
 
     @property
@@ -598,6 +722,11 @@ class StructProperty(Property):
 
     @property
     def fields(self) -> List[Property]:
+        if self._fields is None:
+            self._fields = [FloatProperty(name=axis, tag=0, size=4, value=v)
+                            for axis, v in zip("XYZW", self._components or ())]
+            # from now on the (possibly edited) fields are what gets written
+            self._components = None
         return self._fields
 
     @classmethod
@@ -611,33 +740,21 @@ class StructProperty(Property):
         if type == "Quat":
             # special case: Quat is 4 floats
             assert (prop_size == 16)
-            x = struct.unpack_from('<f', data, offset)[0]
-            y = struct.unpack_from('<f', data, offset + 4)[0]
-            z = struct.unpack_from('<f', data, offset + 8)[0]
-            w = struct.unpack_from('<f', data, offset + 12)[0]
+            components = _QUAT.unpack_from(data, offset)
             offset += 16
-            return cls(name=name, tag=prop_tag, size=prop_size, type=type, guid=guid, fields=[
-                FloatProperty(name="X", tag=0, size=4, value=x),
-                FloatProperty(name="Y", tag=0, size=4, value=y),
-                FloatProperty(name="Z", tag=0, size=4, value=z),
-                FloatProperty(name="W", tag=0, size=4, value=w),
-            ]), offset
+            return cls(name=name, tag=prop_tag, size=prop_size, type=type, guid=guid,
+                       components=components), offset
         elif type == "Vector":
             # special case: Vector is 3 floats
             assert (prop_size == 12)
-            x = struct.unpack_from('<f', data, offset)[0]
-            y = struct.unpack_from('<f', data, offset + 4)[0]
-            z = struct.unpack_from('<f', data, offset + 8)[0]
+            components = _VEC3.unpack_from(data, offset)
             offset += 12
-            return cls(name=name, tag=prop_tag, size=prop_size, type=type, guid=guid, fields=[
-                FloatProperty(name="X", tag=0, size=4, value=x),
-                FloatProperty(name="Y", tag=0, size=4, value=y),
-                FloatProperty(name="Z", tag=0, size=4, value=z),
-            ]), offset
+            return cls(name=name, tag=prop_tag, size=prop_size, type=type, guid=guid,
+                       components=components), offset
         elif type == "DateTime":
             # special case: DateTime is int64 ticks
             assert (prop_size == 8)
-            ticks = struct.unpack_from('<q', data, offset)[0]
+            ticks = _I64.unpack_from(data, offset)[0]
             offset += 8
             return cls(name=name, tag=prop_tag, size=prop_size, type=type, guid=guid, fields=[
                 Int64Property(name="Ticks", tag=0, size=8, value=ticks),
@@ -645,27 +762,13 @@ class StructProperty(Property):
         elif type == "Guid":
             # special case: Guid is 16 bytes
             assert (prop_size == 16)
-            raw = data[offset: offset + 16]
-            offset += 16
-            guid_str = f"{raw[3:4][0]:02x}{raw[2:3][0]:02x}{raw[1:2][0]:02x}{raw[0:1][0]:02x}-" \
-                       f"{raw[5:6][0]:02x}{raw[4:5][0]:02x}-" \
-                       f"{raw[7:8][0]:02x}{raw[6:7][0]:02x}-" \
-                       f"{raw[8:10].hex()}-" \
-                       f"{raw[10:16].hex()}"
+            guid_str, offset = _read_guid(data, offset)
             return cls(name=name, tag=prop_tag, size=prop_size, type=type, guid=guid, fields=[
                 StrProperty(name="Value", tag=0, size=36 +
                             4 + 1, value=guid_str),
             ]), offset
 
-        fields = []
-        end_offset = offset + prop_size
-        while offset < end_offset:
-            field, offset = _read_property(data, offset)
-
-            if field is None:
-                break
-
-            fields.append(field)
+        fields, offset = _read_fields(data, offset, offset + prop_size)
 
         return cls(name=name, tag=prop_tag, size=prop_size, type=type, guid=guid, fields=fields), offset
 
@@ -674,33 +777,40 @@ class StructProperty(Property):
         _write_guid(data, self._guid or "")
         data.append(0)  # null byte
 
+        if self._components is not None:
+            # untouched Quat/Vector: write the floats as read
+            data.extend(_QUAT.pack(*self._components) if self._type == "Quat"
+                        else _VEC3.pack(*self._components))
+            return
+
+        fields = self.fields
         if self._type == "Quat":
-            # special case: Quat is 4 floats
-            assert (len(self._fields) == 4)
-            assert (all(isinstance(field, FloatProperty)
-                    for field in self._fields))
-            for field in self._fields:
-                data.extend(struct.pack('<f', float(field.value)))
+            # special case: Quat is 4 floats (the type check is stripped under -O)
+            x, y, z, w = fields
+            assert (all(isinstance(field, FloatProperty) for field in fields))
+            data.extend(_QUAT.pack(float(x.value), float(y.value), float(z.value), float(w.value)))
             return
         elif self._type == "Vector":
             # special case: Vector is 3 floats
-            assert (len(self._fields) == 3)
-            assert (all(isinstance(field, FloatProperty)
-                    for field in self._fields))
-            for field in self._fields:
-                data.extend(struct.pack('<f', float(field.value)))
+            x, y, z = fields
+            assert (all(isinstance(field, FloatProperty) for field in fields))
+            data.extend(_VEC3.pack(float(x.value), float(y.value), float(z.value)))
             return
 
-        for field in self._fields:
+        for field in fields:
             _write_property(data, field)
-        if len(self._fields) > 0:
+        if len(fields) > 0:
             _write_string(data, "None")
 
     def __str__(self):
-        return f"StructProperty(name={self._name}, type={self._type}, guid={self._guid}, fields={len(self._fields)})"
+        count = len(self._components) if self._components is not None else len(self.fields)
+        return f"StructProperty(name={self._name}, type={self._type}, guid={self._guid}, fields={count})"
 
 
+@_register
 class TextProperty(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: bytes):
         super().__init__(name, tag, size)
         self._value = value
@@ -711,7 +821,7 @@ class TextProperty(Property):
 
     @classmethod
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['TextProperty', int]:
-        value = data[offset: offset + prop_size]
+        value = bytes(data[offset: offset + prop_size])
         offset += prop_size
         offset += 1  # null byte
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
@@ -724,7 +834,10 @@ class TextProperty(Property):
         data.append(0)  # null byte
 
 
+@_register
 class UInt64Property(Property):
+    __slots__ = ('_value',)
+
     def __init__(self, name: str, tag: int, size: int, value: int):
         super().__init__(name, tag, size)
         self._value = value
@@ -736,7 +849,7 @@ class UInt64Property(Property):
     @classmethod
     def from_bytes(cls, name: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple['UInt64Property', int]:
         assert (prop_size == 8)
-        value = struct.unpack_from('<Q', data, offset)[0]
+        value = _U64.unpack_from(data, offset)[0]
         offset += 8
         return cls(name=name, tag=prop_tag, size=prop_size, value=value), offset
 
@@ -744,25 +857,17 @@ class UInt64Property(Property):
         return f"UInt64Property(name={self._name}, value={self._value})"
 
     def to_bytes(self, data: bytearray) -> None:
-        data.extend(struct.pack('<Q', int(self._value)))
+        data.extend(_U64.pack(int(self._value)))
 
 
+# kept for compatibility; a thin wrapper over the _FROM_BYTES registry
 class PropertyFactory:
-    _TYPE_MAP: Dict[str, Type[Property]] = {}
-
-    @classmethod
-    def _build_type_map(cls):
-        for subclass in Property.__subclasses__():
-            cls._TYPE_MAP[subclass.__name__] = subclass
-
     @classmethod
     def create_property(cls, name: str, prop_type: str, prop_size: int, prop_tag: int, data: bytes, offset: int) -> Tuple[Property, int]:
-        if not cls._TYPE_MAP:
-            cls._build_type_map()
-        prop_cls = cls._TYPE_MAP.get(prop_type)
-        if prop_cls is None:
+        from_bytes = _FROM_BYTES.get(prop_type)
+        if from_bytes is None:
             raise ValueError(f"Unknown property type: {prop_type}")
-        return prop_cls.from_bytes(name, prop_size, prop_tag, data, offset)
+        return from_bytes(name, prop_size, prop_tag, data, offset)
 
 
 @dataclass
@@ -771,6 +876,21 @@ class SaveFile:
     properties: List[Property]
 
 
+# (ASCII) characters expected in a SaveGame class path
+_CLASS_NAME_ALLOWED = bytes(sorted(set(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_./\\:-$[]()<>@!%+,' \"")))
+
+
+def _plausible_class_name(s: str) -> bool:
+    if not (1 <= len(s) <= 2048):
+        return False
+    # count allowed characters in C: delete them and measure what is left.
+    # all allowed characters are ASCII, so counting UTF-8 bytes is exact
+    b = s.encode('utf-8', errors='ignore')
+    ok = len(b) - len(b.translate(None, _CLASS_NAME_ALLOWED))
+    return ok / max(1, len(s)) >= 0.75
+
+
 def _read_gvas_header(data: bytes, offset: int = 0) -> Tuple[dict, int]:
     if data[offset: offset + 4] != MAGIC:
         raise ValueError("Not a GVAS header at given offset")
@@ -814,30 +934,18 @@ def _read_gvas_header(data: bytes, offset: int = 0) -> Tuple[dict, int]:
     }
     # CustomVersions + SaveGameClassName (layouts vary by engine/version).
 
-    def _plausible_class_name(s: str) -> bool:
-        if not (1 <= len(s) <= 2048):
-            return False
-        allowed = set(
-            "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_./\\:-$[]()<>@!%+,' \"")
-        ok = sum(1 for ch in s if ch in allowed)
-        if ok / max(1, len(s)) < 0.75:
-            return False
-        # common markers in UE class paths
-        markers = ("/", ".", "_C", "BP_", "SaveGame", "Class", "/Game/")
-        if any(m in s for m in markers):
-            return True
-        return True
-
     fmt, offset = _read_i32(data, offset)
     cnt, offset = _read_i32(data, offset)
     if not (0 <= cnt <= 10000 and 0 <= fmt <= 10):
         raise ValueError
 
-    customs_versions: List[Dict[str, Any]] = []
-    for _ in range(cnt):
-        guid, offset = _read_guid(data, offset)
-        version, offset = _read_i32(data, offset)
-        customs_versions.append({"guid": guid, "version": version})
+    # fixed-size (GUID, i32) records: unpack the whole table in one pass
+    cv_end = offset + cnt * _CUSTOM_VERSION.size
+    customs_versions: List[Dict[str, Any]] = [
+        {"guid": _format_guid(guid), "version": version}
+        for guid, version in _CUSTOM_VERSION.iter_unpack(data[offset: cv_end])
+    ]
+    offset = cv_end
 
     cls_name, offset = _read_string(data, offset)
     assert (_plausible_class_name(cls_name))
@@ -889,10 +997,14 @@ class DecompressionError(Exception):
     pass
 
 
+class CompressionError(Exception):
+    pass
+
+
 def _try_zlib(data: bytes) -> Optional[bytes]:
     # zlib header typically starts with 0x78 0x01/0x9C/0xDA, but not guaranteed
     try:
-        return zlib.decompress(data)
+        return inflate_zlib.decompress(data)
     except Exception:
         return None
 
@@ -900,21 +1012,14 @@ def _try_zlib(data: bytes) -> Optional[bytes]:
 def _try_deflate_raw(data: bytes) -> Optional[bytes]:
     # Raw deflate (no zlib/gzip headers)
     try:
-        return zlib.decompress(data, wbits=-15)
+        return inflate_zlib.decompress(data, -15)
     except Exception:
         return None
 
 
 def _try_gzip(data: bytes) -> Optional[bytes]:
-    # GZIP magic: 1F 8B
-    if len(data) >= 2 and data[0:2] == b"\x1f\x8b":
-        try:
-            return gzip.decompress(data)
-        except Exception:
-            return None
-    # even if no magic, try anyway as a fallback
     try:
-        return gzip.decompress(data)
+        return inflate_gzip.decompress(data)
     except Exception:
         return None
 
@@ -928,17 +1033,159 @@ def _try_lz4(data: bytes) -> Optional[bytes]:
         return None
 
 
-def _try_zstd(data: bytes) -> Optional[bytes]:
+# reusable decompression contexts; a context must not be used by two threads at
+# once, so each thread keeps its own and chunked archives decode in parallel
+_ZSTD_LOCAL = threading.local()
+
+
+def _zstd_context(dict_data: Optional[bytes]) -> Any:
+    # keyed by the raw dictionary bytes, None for the plain context
+    contexts = getattr(_ZSTD_LOCAL, "contexts", None)
+    if contexts is None:
+        contexts = _ZSTD_LOCAL.contexts = {}
+    dctx = contexts.get(dict_data)
+    if dctx is None:
+        if dict_data is None:
+            dctx = zstd.ZstdDecompressor()
+        else:
+            dctx = zstd.ZstdDecompressor(
+                dict_data=zstd.ZstdCompressionDict(dict_data))
+        contexts[dict_data] = dctx
+    return dctx
+
+
+def _zstd_decompress(data: bytes, dict_data: Optional[bytes] = None) -> bytes:
+    dctx = _zstd_context(dict_data)
+    if zstd.frame_content_size(data) >= 0:
+        # size recorded in the frame header: decoded into one exact-size buffer
+        return dctx.decompress(data)
+    # size unknown: stream into a buffer that grows as needed
+    out = bytearray()
+    with dctx.stream_reader(data) as reader:
+        while True:
+            chunk = reader.read(1024 * 1024)
+            if not chunk:
+                break
+            out += chunk
+    return bytes(out)
+
+
+def _try_zstd(data: bytes, dict_data: Optional[bytes] = None) -> Optional[bytes]:
     if zstd is None:
         return None
     try:
-        dctx = zstd.ZstdDecompressor()
-        return dctx.decompress(data)
+        return _zstd_decompress(data, dict_data)
     except Exception:
         return None
 
 
-def decompress_payload(raw_bytes: bytes, method: str = "auto") -> bytes:
+# leading bytes of the self-identifying formats
+_COMPRESSION_MAGICS: Dict[bytes, str] = {
+    b"\x28\xb5\x2f\xfd": "zstd",  # zstd frame
+    b"\x04\x22\x4d\x18": "lz4",  # lz4 frame
+    b"\x1f\x8b": "gzip",  # gzip member header
+}
+_COMPRESSION_ATTEMPTS: Dict[str, Callable[[bytes], Optional[bytes]]] = {
+    "zstd": _try_zstd,
+    "lz4": _try_lz4,
+    "gzip": _try_gzip,
+    "zlib": _try_zlib,
+}
+
+
+def _sniff_compression(data: bytes) -> Optional[str]:
+    head = bytes(data[:4])
+    method = _COMPRESSION_MAGICS.get(head) or _COMPRESSION_MAGICS.get(head[:2])
+    if method is not None:
+        return method
+    # RFC 1950 header: deflate method and a check value making it a multiple of 31
+    if len(head) >= 2 and head[0] & 0x0F == 8 and ((head[0] << 8) | head[1]) % 31 == 0:
+        return "zlib"
+    return None
+
+
+# archives written by UE's FArchive::SerializeCompressed: a summary (package
+# tag, chunk size, compressed and uncompressed totals), one (compressed,
+# uncompressed) size pair per chunk, then the compressed chunks back to back
+_PACKAGE_FILE_TAG = 0x9E2A83C1
+_CHUNKED_SUMMARY = struct.Struct('<4q')
+_CHUNK_SIZES = struct.Struct('<2q')
+
+
+def _parse_chunked_archive(data: bytes) -> Optional[Tuple[List[Tuple[int, int, int, int]], int]]:
+    """
+    Locate the chunks of one or more consecutive compressed archive blocks.
+
+    Returns (compressed offset, compressed size, uncompressed offset,
+    uncompressed size) per chunk and the total uncompressed size, or None
+    if data is not laid out as such an archive.
+    """
+    chunks: List[Tuple[int, int, int, int]] = []
+    total = 0
+    offset = 0
+    end = len(data)
+    while offset < end:
+        if offset + _CHUNKED_SUMMARY.size > end:
+            return None
+        tag, chunk_size, compressed, uncompressed = _CHUNKED_SUMMARY.unpack_from(data, offset)
+        if tag != _PACKAGE_FILE_TAG or chunk_size <= 0 or compressed < 0 or uncompressed < 0:
+            return None
+        offset += _CHUNKED_SUMMARY.size
+        sizes_end = offset + -(-uncompressed // chunk_size) * _CHUNK_SIZES.size
+        if sizes_end + compressed > end:
+            return None
+        chunk_offset = sizes_end
+        block_total = 0
+        for chunk_compressed, chunk_uncompressed in _CHUNK_SIZES.iter_unpack(data[offset: sizes_end]):
+            if not (0 <= chunk_compressed and 0 <= chunk_uncompressed <= chunk_size):
+                return None
+            chunks.append((chunk_offset, chunk_compressed, total + block_total, chunk_uncompressed))
+            chunk_offset += chunk_compressed
+            block_total += chunk_uncompressed
+        if chunk_offset != sizes_end + compressed or block_total != uncompressed:
+            return None
+        total += block_total
+        offset = chunk_offset
+    return (chunks, total) if chunks else None
+
+
+def _decompress_chunked(data: bytes, chunks: List[Tuple[int, int, int, int]], total: int,
+                        method: str, dict_data: Optional[bytes],
+                        out: Optional[bytearray] = None) -> bytearray:
+    view = memoryview(data)
+    if out is None:
+        out = bytearray()
+
+    def decode(chunk: Tuple[int, int, int, int]) -> bytes:
+        chunk_offset, chunk_compressed, out_offset, chunk_uncompressed = chunk
+        block = decompress_payload(
+            view[chunk_offset: chunk_offset + chunk_compressed], method, dict_data)
+        if len(block) != chunk_uncompressed:
+            raise DecompressionError(
+                f"chunk at {chunk_offset} decompressed to {len(block)} bytes, expected {chunk_uncompressed}")
+        return block
+
+    def assemble(blocks: Iterable[bytes]) -> bytearray:
+        # the sizes in the chunk table are only claims: the output grows by
+        # verified blocks, in order, instead of being allocated at the total
+        pos = 0
+        for block in blocks:
+            out[pos: pos + len(block)] = block
+            pos += len(block)
+        return out
+
+    if len(chunks) == 1:
+        return assemble([decode(chunks[0])])
+
+    # chunks are independent and the zlib, lz4 and zstd decoders release the
+    # GIL; zstd uses a context per thread, so all of them overlap
+    with ThreadPoolExecutor(max_workers=min(len(chunks), os.cpu_count() or 1),
+                            thread_name_prefix="uesave-decompress") as pool:
+        return assemble(pool.map(decode, chunks))
+
+
+def decompress_payload(raw_bytes: bytes, method: str = "auto",
+                       dict_data: Optional[bytes] = None) -> bytes:
     """
     Decompress bytes using a chosen method.
 
@@ -950,23 +1197,31 @@ def decompress_payload(raw_bytes: bytes, method: str = "auto") -> bytes:
     - 'lz4': LZ4 frame (requires lz4 package)
     - 'zstd': Zstandard (requires zstandard package)
     - 'auto': try common methods heuristically in order
+
+    UE compressed-chunk archives are recognized by their package tag and
+    their chunks are decompressed in parallel, each with the chosen method.
+
+    dict_data is an optional pretrained zstd dictionary, used for zstd frames.
     """
     m = method.lower()
     if m == "none":
         return raw_bytes
+    chunked = _parse_chunked_archive(raw_bytes)
+    if chunked is not None:
+        return _decompress_chunked(raw_bytes, chunked[0], chunked[1], m, dict_data)
     if m == "zlib":
         try:
-            return zlib.decompress(raw_bytes)
+            return inflate_zlib.decompress(raw_bytes)
         except Exception as e:
             raise DecompressionError(f"zlib failed: {e}")
     if m == "deflate":
         try:
-            return zlib.decompress(raw_bytes, wbits=-15)
+            return inflate_zlib.decompress(raw_bytes, -15)
         except Exception as e:
             raise DecompressionError(f"deflate failed: {e}")
     if m == "gzip":
         try:
-            return gzip.decompress(raw_bytes)
+            return inflate_gzip.decompress(raw_bytes)
         except Exception as e:
             raise DecompressionError(f"gzip failed: {e}")
     if m == "lz4":
@@ -982,99 +1237,242 @@ def decompress_payload(raw_bytes: bytes, method: str = "auto") -> bytes:
             raise DecompressionError(
                 "zstd not available. Install 'zstandard' package.")
         try:
-            dctx = zstd.ZstdDecompressor()
-            return dctx.decompress(raw_bytes)
+            return _zstd_decompress(raw_bytes, dict_data)
         except Exception as e:
             raise DecompressionError(f"zstd failed: {e}")
 
-    # auto heuristic: try fast header checks, then attempts
-    # 1) GZIP magic
-    if len(raw_bytes) >= 2 and raw_bytes[:2] == b"\x1f\x8b":
-        out = _try_gzip(raw_bytes)
-        if out is not None:
-            return out
-    # 2) Zstd frame magic: 28 B5 2F FD
-    if len(raw_bytes) >= 4 and raw_bytes[:4] == b"\x28\xb5\x2f\xfd":
-        out = _try_zstd(raw_bytes)
-        if out is not None:
-            return out
-    # 3) LZ4 frame magic: 04 22 4D 18
-    if len(raw_bytes) >= 4 and raw_bytes[:4] == b"\x04\x22\x4d\x18":
-        out = _try_lz4(raw_bytes)
-        if out is not None:
-            return out
-
-    # 4) try zlib
-    out = _try_zlib(raw_bytes)
+    # auto: dispatch on the frame magic, a single decode attempt per format
+    sniffed = _sniff_compression(raw_bytes)
+    if sniffed == "zstd":
+        out = _try_zstd(raw_bytes, dict_data)
+    elif sniffed is not None:
+        out = _COMPRESSION_ATTEMPTS[sniffed](raw_bytes)
+    else:
+        out = None
     if out is not None:
         return out
 
-    # 5) try raw deflate
+    # raw deflate carries no header to recognize; it is the only blind attempt
     out = _try_deflate_raw(raw_bytes)
     if out is not None:
         return out
 
-    # 6) try gzip even if magic absent
-    out = _try_gzip(raw_bytes)
-    if out is not None:
-        return out
-
-    # 7) try lz4/zstd as last resorts
-    out = _try_lz4(raw_bytes)
-    if out is not None:
-        return out
-    out = _try_zstd(raw_bytes)
-    if out is not None:
-        return out
-
+    if sniffed is not None:
+        raise DecompressionError(
+            f"Payload looks like {sniffed} but failed to decompress. "
+            "Try --compression none|zlib|deflate|gzip|lz4|zstd.")
     raise DecompressionError(
         "Could not decompress payload. Try --compression none|zlib|deflate|gzip|lz4|zstd."
     )
 
 
+# window bits selecting the zlib, raw deflate and gzip framings
+_INFLATE_WBITS = {"zlib": 15, "deflate": -15, "gzip": 31}
+_INFLATE_CHUNK = 1024 * 1024
+
+
+def _inflate_into(raw_bytes: bytes, out: bytearray, wbits: int) -> int:
+    pos = 0
+    data = raw_bytes
+    while True:
+        d = inflate_zlib.decompressobj(wbits)
+        chunk = d.decompress(data, _INFLATE_CHUNK)
+        while chunk:
+            out[pos:pos + len(chunk)] = chunk
+            pos += len(chunk)
+            chunk = d.decompress(d.unconsumed_tail, _INFLATE_CHUNK)
+        if not d.eof:
+            raise DecompressionError("truncated stream")
+        # a decompressobj stops at the end of one gzip member; like
+        # gzip.decompress, continue with the next one and skip zero padding
+        data = d.unused_data.lstrip(b"\x00") if wbits == 31 else b""
+        if not data:
+            return pos
+
+
+def _zstd_decompress_into(raw_bytes: bytes, out: bytearray,
+                          dict_data: Optional[bytes] = None) -> int:
+    with _zstd_context(dict_data).stream_reader(raw_bytes) as reader:
+        # fill the preallocated space in place, then grow only if needed
+        pos = reader.readinto(memoryview(out)) if out else 0
+        while True:
+            chunk = reader.read(_INFLATE_CHUNK)
+            if not chunk:
+                break
+            out[pos:pos + len(chunk)] = chunk
+            pos += len(chunk)
+    return pos
+
+
+def decompress_payload_into(raw_bytes: bytes, out: bytearray, method: str = "auto",
+                            dict_data: Optional[bytes] = None) -> int:
+    """
+    Decompress into a caller-provided buffer, preallocated when the
+    uncompressed size is known. The buffer grows if the output is larger
+    and is truncated to the output length, which is returned.
+
+    Accepts the same methods as decompress_payload.
+    """
+    m = method.lower()
+    chunked = _parse_chunked_archive(raw_bytes) if m != "none" else None
+    if chunked is not None:
+        chunks, total = chunked
+        _decompress_chunked(raw_bytes, chunks, total, m, dict_data, out)
+        del out[total:]
+        return total
+    if m == "auto":
+        # the streaming decoders need the format up front
+        m = _sniff_compression(raw_bytes) or "auto"
+    n = None
+    if m in _INFLATE_WBITS or (m == "zstd" and zstd is not None):
+        try:
+            if m == "zstd":
+                n = _zstd_decompress_into(raw_bytes, out, dict_data)
+            else:
+                n = _inflate_into(raw_bytes, out, _INFLATE_WBITS[m])
+        except Exception as e:
+            if method.lower() != "auto":
+                raise DecompressionError(f"{m} failed: {e}")
+    if n is None:
+        # no streaming decoder applies; decode whole and copy over
+        result = decompress_payload(raw_bytes, method, dict_data)
+        n = len(result)
+        out[:n] = result
+    del out[n:]
+    return n
+
+
 def _read_properties(data: bytes, offset: int, end_offset: int) -> Tuple[List[Property], int]:
     properties = []
+    append = properties.append
+    read_property = _read_property
     while offset < end_offset:
-        prop, offset = _read_property(data, offset)
+        prop, offset = read_property(data, offset)
 
         if prop is None:
             continue
 
-        properties.append(prop)
+        append(prop)
 
     return properties, offset
 
 
 def _write_properties(data: bytearray, properties: List[Property]) -> None:
+    write_property = _write_property
     for prop in properties:
-        _write_property(data, prop)
+        write_property(data, prop)
 
     _write_string(data, 'None')
 
 
-def read_savefile(path: Path, compression: str = "auto") -> SaveFile:
-    data = path.read_bytes()
-    offset = 0
+# write-side context, configured for speed; the frame records the content size
+_ZSTD_CCTX = zstd.ZstdCompressor(level=1) if zstd is not None else None
+_ZSTD_CCTX_LOCK = threading.Lock()
 
-    # if not starting with GVAS, try to auto-decompress the entire file first.
-    if not data.startswith(MAGIC):
+
+def compress_payload(raw_bytes: bytes, method: str = "auto") -> bytes:
+    """
+    Compress bytes using a chosen method, the inverse of decompress_payload.
+
+    method options:
+    - 'none', 'zlib', 'deflate', 'gzip', 'lz4', 'zstd': as in decompress_payload
+    - 'auto': the fastest to decode of the available codecs: lz4, then zstd
+      (level 1), then gzip
+    """
+    m = method.lower()
+    if m == "auto":
+        m = "lz4" if lz4f is not None else "zstd" if zstd is not None else "gzip"
+    if m == "none":
+        return raw_bytes
+    if m == "zlib":
+        return zlib.compress(raw_bytes)
+    if m == "deflate":
+        compressor = zlib.compressobj(wbits=-15)
+        return compressor.compress(raw_bytes) + compressor.flush()
+    if m == "gzip":
+        return gzip.compress(raw_bytes, compresslevel=6)
+    if m == "lz4":
+        if lz4f is None:
+            raise CompressionError(
+                "lz4 not available. Install 'lz4' package.")
+        return lz4f.compress(raw_bytes, compression_level=0)
+    if m == "zstd":
+        if zstd is None:
+            raise CompressionError(
+                "zstd not available. Install 'zstandard' package.")
+        with _ZSTD_CCTX_LOCK:
+            return _ZSTD_CCTX.compress(raw_bytes)
+    raise CompressionError(f"Unknown compression method: {method}")
+
+
+def _map_file(path: Path) -> Union[mmap.mmap, bytes]:
+    """Map a file read-only so its pages are faulted in as the parser walks them."""
+    with open(path, 'rb') as f:
         try:
-            candidate = decompress_payload(data, method=compression)
-            if candidate.startswith(MAGIC):
-                data = candidate
-            # else leave as-is and try parsing below (some games embed GVAS later)
-        except DecompressionError:
-            # leave data as-is; header parse may still succeed if GVAS isn't at start
-            pass
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty or unmappable files: fall back to a plain read
+            return f.read()
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        # parsing only moves forward; let the OS read ahead aggressively
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
+
+
+def _unmap_file(mapped: Union[mmap.mmap, bytes]) -> None:
+    if not isinstance(mapped, mmap.mmap):
+        return
+    try:
+        mapped.close()
+    except BufferError:
+        # views are still referenced (e.g. by a propagating traceback);
+        # the mapping is released once they are collected
+        pass
 
-    # if still no magic at start, search within first 256 bytes
-    if not data.startswith(MAGIC):
-        idx = data.find(MAGIC, 0, 256)
-        if idx != -1:
-            offset = idx
-        else:
-            raise ValueError(
-                "GVAS magic not found. This may not be a UE SaveGame file.")
+
+def _find_magic(data: Union[mmap.mmap, bytes]) -> int:
+    if data[:len(MAGIC)] == MAGIC:
+        return 0
+    # single C-level scan of the whole buffer
+    return data.find(MAGIC)
+
+
+def _decompress_candidate(data: memoryview, compression: str) -> Optional[Tuple[bytearray, int]]:
+    try:
+        # stream into one growing buffer
+        candidate = bytearray()
+        decompress_payload_into(data, candidate, method=compression)
+    except DecompressionError:
+        return None
+    idx = _find_magic(candidate)
+    return (candidate, idx) if idx != -1 else None
+
+
+def _read_savefile_data(data: Union[mmap.mmap, bytes], compression: str) -> SaveFile:
+    offset = _find_magic(data)
+
+    # if not starting with GVAS, try to auto-decompress the entire file first.
+    if offset != 0 and compression.lower() != "none":
+        # decoders get a plain buffer view, not the mmap object itself
+        view = memoryview(data)
+        found = _decompress_candidate(view, compression)
+        if found is None and offset == -1:
+            # no GVAS anywhere: the payload may sit behind a container header
+            for skip in _CONTAINER_PREFIX_SIZES:
+                found = _decompress_candidate(view[skip:], compression)
+                if found is not None:
+                    break
+        if found is not None:
+            data, offset = found
+        # else leave as-is (some games embed GVAS after a prefix)
+
+    if offset == -1:
+        raise ValueError(
+            "GVAS magic not found. This may not be a UE SaveGame file.")
+
+    # parse through a view so that reads slice without copying; payloads
+    # kept by properties are materialized as bytes where they are stored
+    data = memoryview(data)
 
     header, offset = _read_gvas_header(data, offset)
 
@@ -1084,9 +1482,19 @@ def read_savefile(path: Path, compression: str = "auto") -> SaveFile:
     return SaveFile(header=header, properties=properties)
 
 
-def write_savefile(path: Path, save: SaveFile) -> None:
+def read_savefile(path: Path, compression: str = "auto") -> SaveFile:
+    mapped = _map_file(path)
+    try:
+        # parse in a separate frame so every view of the mapping is gone
+        # by the time it is closed
+        return _read_savefile_data(mapped, compression)
+    finally:
+        _unmap_file(mapped)
+
+
+def write_savefile(path: Path, save: SaveFile, compression: str = "none") -> None:
     data = bytearray()
-    # TODO: add support to compression
     _write_gvas_header(data, save.header or {})
     _write_properties(data, save.properties)
-    Path(path).write_bytes(bytes(data))
+    # write_bytes takes the bytearray as is, without another copy
+    Path(path).write_bytes(compress_payload(data, method=compression))
@@ -1,3 +1,4 @@
+import sys
 from argparse import ArgumentParser
 from pathlib import Path
 
@@ -38,21 +39,35 @@ def main():
     print("SaveGame Class Name:",
           save.header.get("save_game_class_name", ""))
 
+    # property lines are buffered and written in batches, not one print each
+    lines = []
+
+    def emit(line: str):
+        lines.append(line)
+        if len(lines) >= 1024:
+            flush()
+
+    def flush():
+        if lines:
+            lines.append('')
+            sys.stdout.write('\n'.join(lines))
+            lines.clear()
+
     def print_prop(prop: Property, indent: int = 0):
         prefix = ' ' * indent
-        print(f"{prefix}{prop}")
+        emit(f"{prefix}{prop}")
         if isinstance(prop, StructProperty):
             for f in prop.fields:
                 print_prop(f, indent + 4)
         elif isinstance(prop, ArrayProperty):
             if prop.inner_type == "ByteProperty":
-                print(f"{prefix}    <{len(prop)} bytes>")
+                emit(f"{prefix}    <{len(prop)} bytes>")
             elif prop.inner_type in ["StrProperty", "NameProperty"]:
                 for i in range(0, len(prop)):
-                    print(f"{prefix}    [{i}] {prop[i]}")
+                    emit(f"{prefix}    [{i}] {prop[i]}")
             elif prop.inner_type == "IntProperty":
                 for i in range(0, len(prop)):
-                    print(f"{prefix}    [{i}] {prop[i]}")
+                    emit(f"{prefix}    [{i}] {prop[i]}")
             elif prop.inner_type == "StructProperty":
                 for i in range(0, len(prop)):
                     print_prop(prop[i], indent + 4)
@@ -60,8 +75,11 @@ def main():
                 raise NotImplementedError(
                     f"ArrayProperty of type {prop.inner_type} not implemented")
 
-    for prop in save.properties:
-        print_prop(prop)
+    try:
+        for prop in save.properties:
+            print_prop(prop)
+    finally:
+        flush()
 
 
 if __name__ == '__main__':
@@ -6,8 +6,15 @@ const statsEl = document.getElementById('stats');
 const treeEl = document.getElementById('tree');
 const pageOverlay = document.getElementById('page-drop-overlay');
 const propSearch = document.getElementById('propSearch');
+// search matches are node paths; only part of the tree may be loaded
 let _searchMatches = [];
+let _searchMatchSet = new Set();
 let _searchIndex = -1;
+let _searchSeq = 0;
+// loaded tree items keyed by node path
+const _itemsByPath = new Map();
+// server-side path of the current upload, used to fetch subtrees on demand
+let _uploadedPath = null;
 
 function setStatus(msg, isError = false) {
     statusEl.textContent = msg || '';
@@ -58,6 +65,11 @@ function makeTreeItem(node) {
     if (node.value !== undefined && node.value !== null) {
         li.dataset.value = String(node.value).toLowerCase();
     }
+    if (node.path !== undefined) {
+        li.dataset.path = node.path;
+        _itemsByPath.set(node.path, li);
+        if (_searchMatchSet.has(node.path)) li.classList.add('match');
+    }
     const label = document.createElement('div');
     label.className = 'label';
     const icon = document.createElement('span');
@@ -77,7 +89,32 @@ function makeTreeItem(node) {
     label.appendChild(text);
     li.appendChild(label);
 
-    if (node.children && node.children.length) {
+    if (node.has_children) {
+        // Subtree is fetched from the server the first time it is expanded
+        const children = document.createElement('ul');
+        children.className = 'children';
+        li._childrenEl = children;
+        children.style.display = 'none';
+        let loaded = null;
+        li._loadChildren = () => {
+            if (!loaded) {
+                loaded = fetchChildren(node.path).then(nodes => {
+                    for (const child of nodes) children.appendChild(makeTreeItem(child));
+                }).catch(e => {
+                    loaded = null;
+                    console.error(e);
+                    setStatus('Error: ' + (e?.message || e), true);
+                });
+            }
+            return loaded;
+        };
+        label.addEventListener('click', async () => {
+            const isHidden = children.style.display === 'none';
+            if (isHidden) await li._loadChildren();
+            children.style.display = isHidden ? 'block' : 'none';
+        });
+        li.appendChild(children);
+    } else if (node.children && node.children.length) {
         const children = document.createElement('ul');
         children.className = 'children';
         // mark children container for expansion in search
@@ -125,44 +162,83 @@ function makeTreeItem(node) {
     return li;
 }
 
+async function fetchJSON(url, failMsg) {
+    const res = await fetch(url);
+    if (!res.ok) {
+        // e.g. an upload the server has already cleaned up (410)
+        let msg = failMsg;
+        try {
+            const err = await res.json();
+            msg = err?.detail || err?.message || JSON.stringify(err);
+        } catch (e) { }
+        throw new Error(msg);
+    }
+    return res.json();
+}
+
+async function fetchChildren(path) {
+    const params = new URLSearchParams({ uploaded_path: _uploadedPath, path });
+    const data = await fetchJSON('/api/expand?' + params.toString(), 'Expand failed');
+    return data.children || [];
+}
+
 function renderTree(nodes) {
     treeEl.innerHTML = '';
+    _itemsByPath.clear();
+    // matches of a previous upload don't apply to this tree
+    _searchSeq++;
+    _searchMatches = [];
+    _searchMatchSet = new Set();
+    _searchIndex = -1;
     for (const n of nodes) treeEl.appendChild(makeTreeItem(n));
 }
 
-// Expand ancestors of a node to ensure visibility
-function expandAncestors(li) {
-    let cur = li.parentElement;
-    while (cur && cur !== treeEl) {
-        if (cur.classList.contains('children')) {
-            cur.style.display = 'block';
-        }
-        cur = cur.parentElement;
+// Load and expand the ancestors of a node path; returns its tree item
+async function revealPath(path) {
+    const parts = path.split('.');
+    for (let i = 1; i < parts.length; i++) {
+        const ancestor = _itemsByPath.get(parts.slice(0, i).join('.'));
+        if (!ancestor || !ancestor._childrenEl) return null;
+        if (ancestor._loadChildren) await ancestor._loadChildren();
+        ancestor._childrenEl.style.display = 'block';
     }
+    return _itemsByPath.get(path) || null;
 }
 
-// Search and highlight
-function runSearch(query) {
-    const q = (query || '').trim().toLowerCase();
-    const items = treeEl.querySelectorAll('.tree-item');
-    let firstMatch = null;
+// Search and highlight; the server searches the whole tree, including
+// subtrees that have not been loaded yet
+async function runSearch(query) {
+    const q = (query || '').trim();
+    const seq = ++_searchSeq;
     // clear previous state
-    items.forEach(li => { li.classList.remove('match'); li.classList.remove('active'); });
+    treeEl.querySelectorAll('.tree-item.match, .tree-item.active').forEach(li => {
+        li.classList.remove('match');
+        li.classList.remove('active');
+    });
     _searchMatches = [];
+    _searchMatchSet = new Set();
     _searchIndex = -1;
-    if (!q) return;
-    items.forEach(li => {
-        const name = li.dataset.name || '';
-        const val = li.dataset.value || '';
-        if (name.includes(q) || val.includes(q)) {
-            li.classList.add('match');
-            _searchMatches.push(li);
-            if (!firstMatch) firstMatch = li;
-        }
-    });
-    if (firstMatch) {
+    if (!q || !_uploadedPath) return;
+    let data;
+    try {
+        const params = new URLSearchParams({ uploaded_path: _uploadedPath, q });
+        data = await fetchJSON('/api/search?' + params.toString(), 'Search failed');
+    } catch (e) {
+        if (seq === _searchSeq) setStatus('Error: ' + (e?.message || e), true);
+        return;
+    }
+    // a newer query has started in the meantime
+    if (seq !== _searchSeq) return;
+    _searchMatches = data.matches || [];
+    _searchMatchSet = new Set(_searchMatches);
+    for (const path of _searchMatches) {
+        const li = _itemsByPath.get(path);
+        if (li) li.classList.add('match');
+    }
+    if (data.truncated) setStatus(`Showing the first ${_searchMatches.length} matches`);
+    if (_searchMatches.length) {
         _searchIndex = 0;
-        setActiveMatch(_searchIndex);
+        await setActiveMatch(_searchIndex);
     }
 }
 
@@ -187,16 +263,18 @@ if (propSearch) {
     });
 }
 
-function setActiveMatch(index) {
+async function setActiveMatch(index) {
     if (!_searchMatches.length) return;
     if (index < 0 || index >= _searchMatches.length) return;
+    const li = await revealPath(_searchMatches[index]);
+    // the subtree failed to load, or the user moved on to another match
+    if (!li || index !== _searchIndex) return;
     // clear existing active
     treeEl.querySelectorAll('.tree-item.active').forEach(el => el.classList.remove('active'));
-    const li = _searchMatches[index];
     li.classList.add('active');
-    expandAncestors(li);
     // If this node has a value child, ensure it is visible
     if (li._childrenEl) {
+        if (li._loadChildren) await li._loadChildren();
         li._childrenEl.style.display = 'block';
     }
     li.scrollIntoView({ behavior: 'smooth', block: 'center' });
@@ -231,6 +309,7 @@ async function upload(file) {
             throw new Error(msg);
         }
         const data = await res.json();
+        _uploadedPath = data.uploaded_path || null;
         renderStats(data.header || {});
         renderTree(data.properties || []);
         setStatus('Done');
@@ -1,133 +1,158 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import re
+import shutil
 import tempfile
 import threading
 import time
 import uuid
 from argparse import ArgumentParser
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import *
 
 from fastapi import FastAPI, File, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from uesave import (ArrayProperty, MapProperty, Property, StructProperty,
-                    TextProperty, read_savefile)
+from uesave import (ArrayProperty, MapProperty, Property, SaveFile,
+                    StructProperty, TextProperty, read_savefile)
+
+# optional faster JSON encoder for the (potentially large) property trees
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
 
 UPLOAD_ROOT = Path(tempfile.gettempdir()) / "uesave_uploads"
 UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
 CLEAN_INTERVAL_SECONDS = 300  # every 5 minutes
 FILE_TTL_SECONDS = 1800  # 30 minutes
+PARSED_CACHE_SIZE = 4  # parsed saves kept in memory for /api/expand
+
 
+def _clean_uploads() -> None:
+    now = time.time()
+    # scandir yields the entry type with the name; only stat() needs a syscall
+    with os.scandir(UPLOAD_ROOT) as entries:
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                age = now - entry.stat().st_mtime
+                if age > FILE_TTL_SECONDS:
+                    os.unlink(entry.path)
+            except OSError:
+                # best-effort cleanup; ignore any file-level errors
+                pass
 
-def _clean_loop() -> None:
+
+async def _clean_loop() -> None:
     while True:
         try:
-            now = time.time()
-            for p in UPLOAD_ROOT.glob("*"):
-                try:
-                    if not p.is_file():
-                        continue
-                    age = now - p.stat().st_mtime
-                    if age > FILE_TTL_SECONDS:
-                        p.unlink(missing_ok=True)
-                except Exception:
-                    # best-effort cleanup; ignore any file-level errors
-                    pass
+            await run_in_threadpool(_clean_uploads)
         except Exception:
             # keep the loop alive on any unexpected error
             pass
-        time.sleep(CLEAN_INTERVAL_SECONDS)
+        await asyncio.sleep(CLEAN_INTERVAL_SECONDS)
 
 
-def _ensure_cleaner_started(app: FastAPI) -> None:
-    # start a background daemon thread once
-    if not getattr(app.state, "_cleaner_started", False):
-        t = threading.Thread(target=_clean_loop,
-                             name="uesave-cleaner", daemon=True)
-        t.start()
-        app.state._cleaner_started = True
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # the cleaner is a task on the server's event loop, not a thread
+    cleaner = asyncio.create_task(_clean_loop())
+    try:
+        yield
+    finally:
+        cleaner.cancel()
 
 
 BASE_DIR = Path(__file__).resolve().parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 STATIC_DIR = BASE_DIR / "static"
 
-app = FastAPI(title="UE Save Inspector", version="0.1.0")
+app = FastAPI(title="UE Save Inspector", version="0.1.0", lifespan=_lifespan)
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 
+# anything but (Unicode) letters, digits, "_", "." and "-"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]+")
+
+
 def _sanitize_filename(name: str) -> str:
-    keep = [c for c in name if c.isalnum() or c in (".", "_", "-")]
-    sanitized = "".join(keep) or "upload.sav"
+    sanitized = _UNSAFE_FILENAME_CHARS.sub("", name) or "upload.sav"
     return sanitized[-100:]
 
 
-def _format_prop_value(obj: Property) -> Optional[str]:
-    """Return a concise, human-friendly value preview for leaf properties.
-    If the property has children (e.g., Struct or Array of Structs), return None.
-    """
-    type = obj.__class__.__name__
-
+def _format_struct(obj: StructProperty) -> Optional[str]:
     # structs are non-leaf; handled as children elsewhere
-    if isinstance(obj, StructProperty):
+    return None
+
+
+def _format_array(obj: ArrayProperty) -> Optional[str]:
+    if obj.inner_type == "ByteProperty":
+        # represent as hex preview
+        v = obj.value or {}
+        vals = v.get("__values", [])
+        # only the previewed head is copied, not the whole array
+        n = len(vals)
+        head = vals[:32]
+        try:
+            b = bytes(head)
+        except Exception:
+            b = bytes([int(x) & 0xFF for x in head])
+        preview = b.hex(" ")
+        more = f" +{n-32}b" if n > 32 else ""
+        return f"{n} bytes: {preview}{more}" if n else "0 bytes"
+    elif obj.inner_type == "StructProperty":
+        # children will be expanded; no single value
         return None
+    else:
+        # generic array summary
+        try:
+            length = len(obj)
+        except Exception:
+            length = 0
+        return f"Array<{obj.inner_type}> with {length} item(s)"
 
-    # Arrays
-    if isinstance(obj, ArrayProperty):
-        if obj.inner_type == "ByteProperty":
-            # represent as hex preview
-            v = obj.value or {}
-            vals = v.get("__values", [])
-            try:
-                b = bytes(vals)
-            except Exception:
-                b = bytes([int(x) & 0xFF for x in vals]) if vals else b""
-            n = len(b)
-            preview = b[:32].hex(" ")
-            more = f" +{n-32}b" if n > 32 else ""
-            return f"{n} bytes: {preview}{more}" if n else "0 bytes"
-        elif obj.inner_type == "StructProperty":
-            # children will be expanded; no single value
-            return None
-        else:
-            # generic array summary
-            try:
-                length = len(obj)
-            except Exception:
-                length = 0
-            return f"Array<{obj.inner_type}> with {length} item(s)"
-
-    # MapProperty and TextProperty use their value payloads for a summary
-    if isinstance(obj, MapProperty):
-        v = getattr(obj, "value", {}) or {}
-        k = v.get("__key_type", "?")
-        val = v.get("__value_type", "?")
-        raw = v.get("__raw", b"")
-        size = len(raw) if isinstance(raw, (bytes, bytearray)) else 0
-        return f"Map<{k}, {val}> raw {size} byte(s)"
-
-    if isinstance(obj, TextProperty):
-        v = getattr(obj, "value", b"")
-        if isinstance(v, (bytes, bytearray)):
-            try:
-                s = v.decode("utf-8", errors="ignore").strip()
-            except Exception:
-                s = ""
-            if s:
-                if len(s) > 200:
-                    s = s[:200] + "…"
-                return f'"{s}"'
-            # fallback to hex/size
-            n = len(v)
-            preview = bytes(v[:32]).hex(" ")
-            more = f" .. +{n-32}b" if n > 32 else ""
-            return f"<Text bytes {n}: {preview}{more}>"
-        return str(v)
 
+def _format_map(obj: MapProperty) -> Optional[str]:
+    # summarized from the value payload
+    v = getattr(obj, "value", {}) or {}
+    k = v.get("__key_type", "?")
+    val = v.get("__value_type", "?")
+    raw = v.get("__raw", b"")
+    size = len(raw) if isinstance(raw, (bytes, bytearray)) else 0
+    return f"Map<{k}, {val}> raw {size} byte(s)"
+
+
+def _format_text(obj: TextProperty) -> Optional[str]:
+    v = getattr(obj, "value", b"")
+    if isinstance(v, (bytes, bytearray)):
+        try:
+            # decode only the displayed head: 800 bytes cover 200 chars of any UTF-8
+            s = v[:800].decode("utf-8", errors="ignore").strip()
+        except Exception:
+            s = ""
+        if s:
+            if len(s) > 200 or len(v) > 800:
+                s = s[:200] + "…"
+            return f'"{s}"'
+        # fallback to hex/size
+        n = len(v)
+        preview = bytes(v[:32]).hex(" ")
+        more = f" .. +{n-32}b" if n > 32 else ""
+        return f"<Text bytes {n}: {preview}{more}>"
+    return str(v)
+
+
+def _format_primitive(obj: Any) -> Optional[str]:
     # primitive leaves: bool/int/float/strings
     try:
         val = obj.value
@@ -148,52 +173,233 @@ def _format_prop_value(obj: Property) -> Optional[str]:
         return None
 
 
+# value formatters keyed by exact class; anything else is a primitive leaf
+_VALUE_FORMATTERS: Dict[type, Callable[[Any], Optional[str]]] = {
+    StructProperty: _format_struct,
+    ArrayProperty: _format_array,
+    MapProperty: _format_map,
+    TextProperty: _format_text,
+}
+
+
+def _format_prop_value(obj: Property) -> Optional[str]:
+    """Return a concise, human-friendly value preview for leaf properties.
+    If the property has children (e.g., Struct or Array of Structs), return None.
+    """
+    return _VALUE_FORMATTERS.get(type(obj), _format_primitive)(obj)
+
+
+def _struct_children(obj: StructProperty) -> Tuple[str, List[Any]]:
+    fields = obj.fields
+    return f"{len(fields)} field(s)", fields
+
+
+def _array_children(obj: ArrayProperty) -> Tuple[str, List[Any]]:
+    if obj.inner_type == "ByteProperty":
+        return f"{len(obj)} bytes", []
+    elif obj.inner_type in ["StrProperty", "NameProperty", "IntProperty"]:
+        return f"Array<{obj.inner_type}> x {len(obj)}", list(obj)
+    elif obj.inner_type == "StructProperty":
+        return f"{len(obj)} struct(s)", list(obj)
+    else:
+        return f"Array<{obj.inner_type}> x {len(obj)}", []
+
+
+# classes whose nodes can have children, keyed by exact class
+_CHILD_GETTERS: Dict[type, Callable[[Any], Tuple[str, List[Any]]]] = {
+    StructProperty: _struct_children,
+    ArrayProperty: _array_children,
+}
+
+
+def _node_children(obj: Any) -> Tuple[str, List[Any]]:
+    """Return the meta summary and the child objects shown under a node."""
+    getter = _CHILD_GETTERS.get(type(obj))
+    return getter(obj) if getter is not None else ("", [])
+
+
 def create_node(obj: Any) -> Dict[str, Any]:
-    type = obj.__class__.__name__
-    name = getattr(obj, "name", "")
-    meta: str = ""
-    children: List[Dict[str, Any]] = []
-
-    if isinstance(obj, StructProperty):
-        meta = f"{len(obj.fields)} field(s)"
-        children = [create_node(f) for f in obj.fields]
-    elif isinstance(obj, ArrayProperty):
-        if obj.inner_type == "ByteProperty":
-            meta = f"{len(obj)} bytes"
-            children = []
-        elif obj.inner_type in ["StrProperty", "NameProperty"]:
-            meta = f"Array<{obj.inner_type}> x {len(obj)}"
-            children = [create_node(obj[i]) for i in range(len(obj))]
-        elif obj.inner_type == "IntProperty":
-            meta = f"Array<{obj.inner_type}> x {len(obj)}"
-            children = [create_node(obj[i]) for i in range(len(obj))]
-        elif obj.inner_type == "StructProperty":
-            meta = f"{len(obj)} struct(s)"
-            children = [create_node(obj[i]) for i in range(len(obj))]
+    # walk with an explicit stack: deeply nested saves can't hit the recursion
+    # limit, and each node dict is allocated up front in its parent's list
+    root: Dict[str, Any] = {}
+    stack = [(obj, root)]
+    while stack:
+        item, node = stack.pop()
+        meta, kids = _node_children(item)
+        node["name"] = getattr(item, "name", "")
+        node["type"] = type(item).__name__
+        node["meta"] = meta
+        if kids:
+            children: List[Dict[str, Any]] = [{} for _ in kids]
+            node["children"] = children
+            node["value"] = None
+            stack.extend(zip(kids, children))
         else:
-            meta = f"Array<{obj.inner_type}> x {len(obj)}"
-            children = []
+            node["children"] = None
+            node["value"] = _format_prop_value(item)
+    return root
+
+
+def create_shallow_node(obj: Any, path: str) -> Dict[str, Any]:
+    """Like create_node, but children are not walked: non-leaf nodes carry
+    has_children/child_count and the path to pass to /api/expand instead."""
+    meta, kids = _node_children(obj)
+    node: Dict[str, Any] = {
+        "name": getattr(obj, "name", ""),
+        "type": type(obj).__name__,
+        "meta": meta,
+        "children": None,
+        "path": path,
+    }
+    if kids:
+        node["has_children"] = True
+        node["child_count"] = len(kids)
+        node["value"] = None
+    else:
+        node["has_children"] = False
+        node["child_count"] = 0
+        node["value"] = _format_prop_value(obj)
+    return node
+
+
+class _TreeJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# parsed saves keyed by uploaded path: (last access time, save), least recently used first
+_PARSED_CACHE: "OrderedDict[str, Tuple[float, SaveFile]]" = OrderedDict()
+_PARSED_CACHE_LOCK = threading.Lock()
+
+
+def _cache_save(path: Path, save: SaveFile) -> None:
+    with _PARSED_CACHE_LOCK:
+        _PARSED_CACHE[str(path)] = (time.time(), save)
+        _PARSED_CACHE.move_to_end(str(path))
+        while len(_PARSED_CACHE) > PARSED_CACHE_SIZE:
+            _PARSED_CACHE.popitem(last=False)
+
+
+def _cached_save(path: Path) -> SaveFile:
+    """Return the parsed save for an upload, re-reading it on a miss or once
+    its entry has been idle for FILE_TTL_SECONDS. Raises FileNotFoundError
+    when the upload is neither cached nor on disk any more."""
+    key = str(path)
+    now = time.time()
+    save = None
+    with _PARSED_CACHE_LOCK:
+        entry = _PARSED_CACHE.get(key)
+        if entry is not None:
+            if now - entry[0] <= FILE_TTL_SECONDS:
+                _PARSED_CACHE[key] = (now, entry[1])
+                _PARSED_CACHE.move_to_end(key)
+                save = entry[1]
+            else:
+                del _PARSED_CACHE[key]
+    if save is None:
+        save = read_savefile(path)
+        _cache_save(path, save)
+    try:
+        # the cleaner expires uploads by mtime: keep the ones being browsed alive
+        os.utime(path)
+    except OSError:
+        pass
+    return save
+
+
+def _parse_upload(path: Path, full: bool = False) -> Dict[str, Any]:
+    save = read_savefile(path)
+    _cache_save(path, save)
+    if full:
+        properties = [create_node(p) for p in save.properties]
+    else:
+        properties = [create_shallow_node(p, str(i))
+                      for i, p in enumerate(save.properties)]
+    return {
+        "header": save.header,
+        "properties": properties,
+        "uploaded_path": str(path),
+    }
+
+
+# dot-separated child indices, without signs or leading zeros
+_NODE_PATH = re.compile(r"(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*))*")
 
-    value = None
-    if not children:
-        value = _format_prop_value(obj)
 
+def _expand(path: Path, node_path: str) -> Dict[str, Any]:
+    save = _cached_save(path)
+    # node paths are dot-separated child indices starting at the top-level properties
+    # only the canonical form node paths are reported in: int() alone would also
+    # take "-1" (counting from the end), "+1" or "01" as aliases of other nodes
+    if not _NODE_PATH.fullmatch(node_path):
+        raise HTTPException(status_code=404, detail=f"No such node: {node_path}")
+    try:
+        indices = [int(i) for i in node_path.split(".")]
+        obj = save.properties[indices[0]]
+        for i in indices[1:]:
+            obj = _node_children(obj)[1][i]
+    except IndexError:
+        raise HTTPException(status_code=404, detail=f"No such node: {node_path}")
+    _, kids = _node_children(obj)
     return {
-        "name": name,
-        "type": type,
-        "meta": meta,
-        "children": children if children else None,
-        "value": value,
+        "path": node_path,
+        "children": [create_shallow_node(k, f"{node_path}.{i}")
+                     for i, k in enumerate(kids)],
     }
 
 
+def _search(path: Path, query: str, limit: int) -> Dict[str, Any]:
+    """Paths of the nodes whose name or value preview contains the query, in
+    tree order. Walks the whole tree, including subtrees not yet expanded."""
+    save = _cached_save(path)
+    q = query.strip().lower()
+    matches: List[str] = []
+    if not q:
+        return {"matches": matches, "truncated": False}
+    stack = [(p, str(i)) for i, p in reversed(list(enumerate(save.properties)))]
+    while stack:
+        item, node_path = stack.pop()
+        _, kids = _node_children(item)
+        found = q in getattr(item, "name", "").lower()
+        if kids:
+            stack.extend((k, f"{node_path}.{i}")
+                         for i, k in reversed(list(enumerate(kids))))
+        elif not found:
+            # only leaves have a value preview
+            value = _format_prop_value(item)
+            found = value is not None and q in value.lower()
+        if found:
+            if len(matches) == limit:
+                return {"matches": matches, "truncated": True}
+            matches.append(node_path)
+    return {"matches": matches, "truncated": False}
+
+
+def _upload_path(uploaded_path: str) -> Path:
+    # only files the upload endpoint wrote may be opened
+    dest = UPLOAD_ROOT / Path(uploaded_path).name
+    if str(dest) != uploaded_path:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return dest
+
+
+def _upload_expired() -> HTTPException:
+    return HTTPException(
+        status_code=410,
+        detail="This upload has expired on the server. Please upload the file again.")
+
+
 @app.get("/")
 def index(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.post("/api/upload")
-async def api_upload(file: UploadFile = File(...)) -> JSONResponse:
+@app.post("/api/upload", response_class=_TreeJSONResponse)
+async def api_upload(file: UploadFile = File(...), full: bool = False) -> JSONResponse:
     if not file.filename:
         raise HTTPException(status_code=400, detail="Missing filename")
     if not file.filename.lower().endswith(".sav"):
@@ -205,12 +411,10 @@ async def api_upload(file: UploadFile = File(...)) -> JSONResponse:
     dest = UPLOAD_ROOT / unique
 
     try:
+        # the upload is already spooled by the server; copy it to disk off the
+        # event loop instead of awaiting each chunk and writing it inline
         with dest.open('wb') as f:
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                f.write(chunk)
+            await run_in_threadpool(shutil.copyfileobj, file.file, f, 1024 * 1024)
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to save file: {e}")
@@ -218,13 +422,10 @@ async def api_upload(file: UploadFile = File(...)) -> JSONResponse:
         await file.close()
 
     try:
-        save = read_savefile(dest)
-        nodes = [create_node(p) for p in save.properties]
-        return JSONResponse({
-            "header": save.header,
-            "properties": nodes,
-            "uploaded_path": str(dest),
-        })
+        # parsing and tree building are CPU-bound; keep them off the event loop.
+        # unless the full tree is requested, only top-level nodes are sent and
+        # subtrees are fetched via /api/expand
+        return _TreeJSONResponse(await run_in_threadpool(_parse_upload, dest, full))
     except Exception as e:
         # On failure, include the exception type and message; cleaner will purge file later.
         err_type = e.__class__.__name__
@@ -233,6 +434,36 @@ async def api_upload(file: UploadFile = File(...)) -> JSONResponse:
             status_code=400, detail=f"Parse error ({err_type}): {err_msg}")
 
 
+@app.get("/api/expand", response_class=_TreeJSONResponse)
+async def api_expand(uploaded_path: str, path: str) -> JSONResponse:
+    dest = _upload_path(uploaded_path)
+    try:
+        return _TreeJSONResponse(await run_in_threadpool(_expand, dest, path))
+    except HTTPException:
+        raise
+    except FileNotFoundError:
+        raise _upload_expired()
+    except Exception as e:
+        err_type = e.__class__.__name__
+        err_msg = str(e) or repr(e)
+        raise HTTPException(
+            status_code=400, detail=f"Parse error ({err_type}): {err_msg}")
+
+
+@app.get("/api/search", response_class=_TreeJSONResponse)
+async def api_search(uploaded_path: str, q: str, limit: int = 1000) -> JSONResponse:
+    dest = _upload_path(uploaded_path)
+    try:
+        return _TreeJSONResponse(await run_in_threadpool(_search, dest, q, max(0, limit)))
+    except FileNotFoundError:
+        raise _upload_expired()
+    except Exception as e:
+        err_type = e.__class__.__name__
+        err_msg = str(e) or repr(e)
+        raise HTTPException(
+            status_code=400, detail=f"Parse error ({err_type}): {err_msg}")
+
+
 def main() -> None:
     parser = ArgumentParser(prog="uesave_webapp",
                             description="uesave Web App")
@@ -249,4 +480,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-    main()